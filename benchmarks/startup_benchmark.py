@@ -0,0 +1,136 @@
+"""Startup benchmark for the DTA-SLO controller.
+
+Runs the controller in fresh interpreters and reports, per scenario, the
+median wall-clock time and the peak resident set size:
+
+- ``import``: importing ``main`` (what CLI subcommands and tests pay)
+- ``first-cycle``: ``main.py --once --dry-run``, i.e. time-to-first-cycle
+  of a freshly started controller. No traffic has been recorded yet, so
+  the prediction stage is skipped and TensorFlow and SciPy are never loaded.
+- ``seeded-cycle``: one dry-run cycle after seeding every service/chain
+  with a full window of synthetic traffic, so the GRU predictor
+  (TensorFlow) and the performance quantifier (SciPy) run as well. Skipped
+  when TensorFlow is not installed.
+
+Usage:
+    python benchmarks/startup_benchmark.py [--runs N] [--config PATH]
+"""
+import argparse
+import importlib.util
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs one dry-run cycle with a full prediction window of synthetic traffic
+SEEDED_CYCLE = """
+import sys, time
+import main
+
+config = main.load_config(sys.argv[1])
+services = main.load_service_configs(config)
+traffic_monitor, allocator = main.build_components(config)
+try:
+    now = time.time()
+    samples = config['prediction']['sequence_length']
+    for service_id, service in services.items():
+        for chain_id in service.chains:
+            for i in range(samples):
+                metrics = {'timestamp': now - samples + i, 'rps': 50.0 + i % 7,
+                           'response_time': 0.05 + 0.001 * i, 'error_rate': 0.01}
+                traffic_monitor.traffic_data[service_id][chain_id].append(metrics)
+                allocator.performance_quantifier.update_profile(service_id, chain_id, metrics)
+    main.run_cycle(allocator, services, config.get('slos') or {}, dry_run=True)
+finally:
+    traffic_monitor.stop()
+"""
+
+
+def _max_rss_mb(max_rss: int) -> float:
+    # ru_maxrss is reported in kilobytes on Linux and in bytes on macOS
+    if sys.platform == 'darwin':
+        return max_rss / (1024 * 1024)
+    return max_rss / 1024
+
+
+def _exit_code(status: int) -> int:
+    if hasattr(os, 'waitstatus_to_exitcode'):
+        return os.waitstatus_to_exitcode(status)
+    # Python 3.8 fallback, same convention as subprocess: -signal if killed
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+def run_once(command: List[str]) -> Tuple[float, float]:
+    with tempfile.TemporaryFile() as stderr:
+        start = time.perf_counter()
+        process = subprocess.Popen(
+            command,
+            cwd=REPO_ROOT,
+            stdout=subprocess.DEVNULL,
+            stderr=stderr
+        )
+        # wait4 gives the resource usage of this child alone
+        _, status, usage = os.wait4(process.pid, 0)
+        elapsed = time.perf_counter() - start
+        process.returncode = _exit_code(status)
+
+        if process.returncode != 0:
+            stderr.seek(0)
+            raise RuntimeError(f"{' '.join(command)} failed:\n"
+                               f"{stderr.read().decode(errors='replace')}")
+    return elapsed, _max_rss_mb(usage.ru_maxrss)
+
+
+def benchmark(runs: int, config_path: str) -> Dict[str, Optional[Dict[str, float]]]:
+    scenarios = {
+        'import': [sys.executable, '-c', 'import main'],
+        'first-cycle': [sys.executable, 'main.py', '--config', config_path,
+                        '--once', '--dry-run'],
+        'seeded-cycle': [sys.executable, '-c', SEEDED_CYCLE, config_path],
+    }
+
+    results = {}
+    for name, command in scenarios.items():
+        if name == 'seeded-cycle' and importlib.util.find_spec('tensorflow') is None:
+            results[name] = None
+            continue
+        timings, peaks = [], []
+        for _ in range(runs):
+            elapsed, peak_rss = run_once(command)
+            timings.append(elapsed)
+            peaks.append(peak_rss)
+        results[name] = {
+            'median_seconds': statistics.median(timings),
+            'peak_rss_mb': max(peaks)
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5,
+                        help="number of fresh interpreters per scenario")
+    parser.add_argument('--config', default='config/config.yaml',
+                        help="controller configuration to start with")
+    args = parser.parse_args()
+
+    results = benchmark(args.runs, args.config)
+
+    print(f"{'scenario':<12} {'median (s)':>12} {'peak RSS (MB)':>15}")
+    for name, result in results.items():
+        if result is None:
+            print(f"{name:<12} skipped (tensorflow not installed)")
+            continue
+        print(f"{name:<12} {result['median_seconds']:>12.3f} "
+              f"{result['peak_rss_mb']:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
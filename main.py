@@ -1,59 +1,189 @@
-import yaml
-from src.components.traffic_monitor import TrafficMonitor
-from src.components.traffic_predictor import TrafficPredictor
-from src.components.performance_quantifier import PerformanceImpactQuantifier
-from src.components.resource_allocator import DynamicResourceAllocator
+import argparse
+import logging
+import os
+import socket
 import time
+from typing import Any, Dict, Optional, Sequence
+
+import yaml
+
+from src.models.data_models import ServiceConfig
 
-def load_config():
-    with open('config/config.yaml', 'r') as f:
+DEFAULT_CONFIG_PATH = 'config/config.yaml'
+OPTIMIZATION_INTERVAL = 300  # 5 minutes
+
+def load_config(path: str = DEFAULT_CONFIG_PATH) -> Dict[str, Any]:
+    with open(path, 'r') as f:
         return yaml.safe_load(f)
 
-def main():
-    # Load configuration
-    config = load_config()
-    
-    # Initialize components
+def load_service_configs(config: Dict[str, Any]) -> Dict[str, ServiceConfig]:
+    return {
+        service_id: ServiceConfig.from_dict(service_id, service)
+        for service_id, service in (config.get('services') or {}).items()
+    }
+
+def build_components(config: Dict[str, Any]):
+    # Components are imported here rather than at module level so that
+    # importing this module (CLI parsing, tooling, tests) stays cheap.
+    # TensorFlow, SciPy, PuLP and the Kubernetes client are further deferred
+    # inside the components until a stage actually needs them.
+    from src.components.traffic_monitor import TrafficMonitor
+    from src.components.traffic_predictor import TrafficPredictor
+    from src.components.performance_quantifier import PerformanceImpactQuantifier
+    from src.components.resource_allocator import DynamicResourceAllocator
+
     traffic_monitor = TrafficMonitor(
         sampling_interval=config['monitoring']['sampling_interval']
     )
-    
+
     traffic_predictor = TrafficPredictor(
         sequence_length=config['prediction']['sequence_length'],
         prediction_horizon=config['prediction']['prediction_horizon'],
         feature_dim=config['prediction']['feature_dim']
     )
-    
+
     performance_quantifier = PerformanceImpactQuantifier()
-    
+
     allocator = DynamicResourceAllocator(
         traffic_monitor,
         traffic_predictor,
         performance_quantifier
     )
+    return traffic_monitor, allocator
+
+def build_shard_manager(config: Dict[str, Any], replica_id: Optional[str] = None):
+    sharding = config.get('sharding') or {}
+    if not sharding.get('enabled', False):
+        return None
+
+    from src.components.shard_manager import ShardManager
+    from src.utils.coordination import FileCoordinationBackend
+
+    # The in-memory backend is process-local and only meant for tests, so
+    # it cannot be selected here
+    backend_type = sharding.get('backend', 'file')
+    if backend_type != 'file':
+        raise ValueError(f"Unknown coordination backend: {backend_type}")
+    if not sharding.get('lease_path'):
+        raise ValueError("sharding.lease_path must be set when sharding is enabled")
+
+    lease_dir = os.path.dirname(os.path.abspath(sharding['lease_path']))
+    if not os.path.isdir(lease_dir) or not os.access(lease_dir, os.W_OK):
+        raise ValueError(f"Lease directory {lease_dir} does not exist or is not writable")
+
+    backend = FileCoordinationBackend(sharding['lease_path'])
+    if not backend.is_shared():
+        logging.getLogger(__name__).warning(
+            f"Lease file {backend.path} is not on a recognised shared filesystem "
+            f"({backend.filesystem_type() or 'unknown'}); only replicas on this "
+            f"host will coordinate, replicas on other hosts will each own "
+            f"every service")
+
+    return ShardManager(
+        replica_id=replica_id or sharding.get('replica_id') or socket.gethostname(),
+        backend=backend,
+        lease_ttl=sharding.get('lease_ttl', 60.0),
+        virtual_nodes=sharding.get('virtual_nodes', 64)
+    )
+
+def run_cycle(allocator,
+              services: Dict[str, ServiceConfig],
+              slos: Dict[str, float],
+              dry_run: bool = False,
+              shard_manager=None):
+    new_allocations = allocator.optimize_resources(services, slos)
+
+    if shard_manager is not None:
+        # Ownership may have been lost while optimizing; only touch
+        # services whose leases are still held
+        still_owned = shard_manager.renew()
+        new_allocations = {
+            service_id: allocation
+            for service_id, allocation in new_allocations.items()
+            if service_id in still_owned
+        }
+
+    if dry_run:
+        print("Computed resource allocations (dry run, not applied):")
+    elif allocator.apply_allocations(new_allocations):
+        print("Successfully updated resource allocations:")
+    else:
+        return new_allocations
+
+    for service_id, allocation in new_allocations.items():
+        print(f"{service_id}: CPU={allocation.cpu}, "
+              f"Memory={allocation.memory}, "
+              f"Instances={allocation.instances}")
+    return new_allocations
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="DTA-SLO resource controller")
+    parser.add_argument('--config', default=DEFAULT_CONFIG_PATH,
+                        help="path to the controller configuration file")
+    parser.add_argument('--once', action='store_true',
+                        help="run a single optimization cycle and exit")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="compute allocations without applying them to Kubernetes")
+    parser.add_argument('--replica-id',
+                        help="identity of this replica when sharding is enabled")
+    return parser.parse_args(argv)
+
+def main(argv: Optional[Sequence[str]] = None):
+    args = parse_args(argv)
+
+    # Load configuration once; services are kept as typed ServiceConfig objects
+    config = load_config(args.config)
+    services = load_service_configs(config)
+    slos = config.get('slos') or {}
+
+    # Validate sharding settings before any component starts a thread
+    shard_manager = build_shard_manager(config, args.replica_id)
+
+    # Initialize components
+    traffic_monitor, allocator = build_components(config)
 
     try:
+        if shard_manager is not None:
+            # Newly acquired services are monitored right away, not only
+            # from the next optimization cycle
+            traffic_monitor.set_services(())
+            shard_manager.on_change = traffic_monitor.set_services
+            shard_manager.start()
+            # Replicas that already own services release this replica's
+            # share on their next heartbeat; wait for that before the first
+            # assignment so it does not start out with nothing
+            time.sleep(2 * shard_manager.heartbeat_interval)
+
         while True:
+            # When sharded, only optimize the services this replica owns
+            owned_services = services
+            if shard_manager is not None:
+                owned_services = shard_manager.assign(services)
+                print(f"Replica {shard_manager.replica_id} owns "
+                      f"{len(owned_services)}/{len(services)} services")
+
             # Optimize resources periodically
-            new_allocations = allocator.optimize_resources(
-                config['services'],
-                config['slos']
-            )
-            
-            # Apply new allocations
-            if allocator.apply_allocations(new_allocations):
-                print("Successfully updated resource allocations:")
-                for service_id, allocation in new_allocations.items():
-                    print(f"{service_id}: CPU={allocation.cpu}, "
-                          f"Memory={allocation.memory}, "
-                          f"Instances={allocation.instances}")
-            
+            if owned_services:
+                run_cycle(allocator, owned_services, slos,
+                          dry_run=args.dry_run, shard_manager=shard_manager)
+            if args.once:
+                break
+
             # Wait before next optimization
-            time.sleep(300)  # 5 minutes
+            time.sleep(OPTIMIZATION_INTERVAL)
 
     except KeyboardInterrupt:
         print("Shutting down...")
-        traffic_monitor.stop()
+    finally:
+        # The monitor thread is not a daemon, so it must be stopped even if
+        # releasing the leases fails
+        try:
+            if shard_manager is not None:
+                shard_manager.stop()
+        except Exception as e:
+            logging.getLogger(__name__).error(f"Failed to release shard leases: {str(e)}")
+        finally:
+            traffic_monitor.stop()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
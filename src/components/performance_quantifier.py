@@ -1,7 +1,6 @@
 from src.models.metrics import PerformanceMetrics, LoadLatencyProfile
 from typing import Dict, List, Optional
 import numpy as np
-from scipy.stats import linregress
 
 class PerformanceProfile:
     def __init__(self, service_id: str, chain_id: str):
@@ -19,6 +18,7 @@ class PerformanceProfile:
         
         # Update regression model if we have enough points
         if len(self.load_points) >= 2:
+            from scipy.stats import linregress
             self.regression_model = linregress(self.load_points, self.latency_points)
 
     def predict_latency(self, load: float) -> float:
@@ -2,51 +2,91 @@ from src.models.data_models import ResourceAllocation, ServiceConfig
 from src.components.traffic_monitor import TrafficMonitor
 from src.components.traffic_predictor import TrafficPredictor
 from src.components.performance_quantifier import PerformanceImpactQuantifier
-from typing import Dict, List
-import pulp
+from typing import TYPE_CHECKING, Dict, Optional
+import logging
+import numpy as np
+
+if TYPE_CHECKING:
+    from kubernetes import client
 
 
 class DynamicResourceAllocator:
     def __init__(self,
                  traffic_monitor: TrafficMonitor,
                  traffic_predictor: TrafficPredictor,
-                 performance_quantifier: PerformanceImpactQuantifier):
+                 performance_quantifier: PerformanceImpactQuantifier,
+                 namespace: str = "default"):
         self.traffic_monitor = traffic_monitor
         self.traffic_predictor = traffic_predictor
         self.performance_quantifier = performance_quantifier
         self.current_allocations: Dict[str, ResourceAllocation] = {}
-        self.min_cpu = 0.1  # Minimum CPU cores
-        self.min_memory = 128  # Minimum memory in MB
-        self.max_cpu = 4.0  # Maximum CPU cores
-        self.max_memory = 8192  # Maximum memory in MB
+        self.min_instances = 1
+        self.max_instances = 10
+        self.namespace = namespace
+        self.logger = logging.getLogger(__name__)
+        self._apps_v1 = None
+
+    @property
+    def apps_v1(self) -> 'client.AppsV1Api':
+        # The Kubernetes client is imported and configured on first use so
+        # that optimization-only runs never load it.
+        if self._apps_v1 is None:
+            from kubernetes import client, config
+            config.load_kube_config()
+            self._apps_v1 = client.AppsV1Api()
+        return self._apps_v1
 
     def optimize_resources(self, 
-                         services: Dict[str, List[str]],  # service_id -> list of chain_ids
+                         services: Dict[str, ServiceConfig],  # service_id -> service config
                          slos: Dict[str, float]  # chain_id -> latency SLO
                          ) -> Dict[str, ResourceAllocation]:
+        import pulp
+
         # Create optimization problem
         problem = pulp.LpProblem("Resource_Allocation", pulp.LpMinimize)
 
-        # Decision variables
+        # Decision variables. Cost and capacity are products of per-instance
+        # resources and the instance count, which is not linear, so the
+        # instance count is enumerated instead: for every candidate count n
+        # a binary selects it and per-instance CPU/memory variables are only
+        # allowed to be non-zero for the selected n. n * cpu_n is then linear.
+        instance_counts = range(self.min_instances, self.max_instances + 1)
         allocations = {}
-        for service_id in services:
+        for service_id, service in services.items():
+            selected = {n: pulp.LpVariable(f"use_{service_id}_{n}", cat='Binary')
+                        for n in instance_counts}
+            cpu = {n: pulp.LpVariable(f"cpu_{service_id}_{n}", 0, service.max_cpu)
+                   for n in instance_counts}
+            memory = {n: pulp.LpVariable(f"memory_{service_id}_{n}", 0, service.max_memory)
+                      for n in instance_counts}
+
+            problem += pulp.lpSum(selected.values()) == 1
+            for n in instance_counts:
+                problem += cpu[n] >= service.min_cpu * selected[n]
+                problem += cpu[n] <= service.max_cpu * selected[n]
+                problem += memory[n] >= service.min_memory * selected[n]
+                problem += memory[n] <= service.max_memory * selected[n]
+
             allocations[service_id] = {
-                'cpu': pulp.LpVariable(f"cpu_{service_id}", self.min_cpu, self.max_cpu),
-                'memory': pulp.LpVariable(f"memory_{service_id}", self.min_memory, self.max_memory),
-                'instances': pulp.LpVariable(f"instances_{service_id}", 1, 10, cat='Integer')
+                'selected': selected,
+                'cpu': cpu,
+                'memory': memory,
+                # Total CPU across all instances of the service
+                'total_cpu': pulp.lpSum(n * cpu[n] for n in instance_counts)
             }
 
         # Objective function: Minimize total resource cost
         problem += pulp.lpSum([
-            allocations[service_id]['cpu'] * allocations[service_id]['instances'] * 100 +  # CPU cost weight
-            allocations[service_id]['memory'] * allocations[service_id]['instances'] * 0.1  # Memory cost weight
+            n * allocations[service_id]['cpu'][n] * 100 +  # CPU cost weight
+            n * allocations[service_id]['memory'][n] * 0.1  # Memory cost weight
             for service_id in services
+            for n in instance_counts
         ])
 
         # Add constraints
-        for service_id, chain_ids in services.items():
+        for service_id, service in services.items():
             # Get traffic predictions for each chain
-            for chain_id in chain_ids:
+            for chain_id in service.chains:
                 metrics = self.traffic_monitor.get_metrics(service_id, chain_id)
                 if not metrics:
                     continue
@@ -60,24 +100,33 @@ class DynamicResourceAllocator:
                 impact = self.performance_quantifier.analyze_impact(
                     service_id, chain_id, predicted_load)
 
-                # Add SLO constraint
-                problem += (
-                    impact['expected_latency'] * 
-                    (1.0 / allocations[service_id]['cpu']) * 
-                    (1.0 / allocations[service_id]['instances']) <= 
-                    slos[chain_id] * impact['risk_factor']
-                )
+                # Add SLO constraint. Latency scales with 1 / (cpu * instances),
+                # so latency / (cpu * instances) <= slo * risk is expressed as
+                # the linear capacity constraint cpu * instances >= latency / (slo * risk).
+                if impact['expected_latency'] > 0:
+                    problem += (
+                        allocations[service_id]['total_cpu'] >=
+                        impact['expected_latency'] / (slos[chain_id] * impact['risk_factor'])
+                    )
 
         # Solve optimization problem
-        problem.solve()
+        problem.solve(pulp.PULP_CBC_CMD(msg=False))
+        if pulp.LpStatus[problem.status] != 'Optimal':
+            self.logger.warning(
+                f"Resource allocation problem is {pulp.LpStatus[problem.status]}, "
+                f"keeping current allocations")
+            return {}
 
         # Extract results
         result = {}
         for service_id in services:
+            variables = allocations[service_id]
+            instances = max(instance_counts,
+                            key=lambda n: pulp.value(variables['selected'][n]))
             result[service_id] = ResourceAllocation(
-                cpu=pulp.value(allocations[service_id]['cpu']),
-                memory=pulp.value(allocations[service_id]['memory']),
-                instances=int(pulp.value(allocations[service_id]['instances']))
+                cpu=pulp.value(variables['cpu'][instances]),
+                memory=pulp.value(variables['memory'][instances]),
+                instances=instances
             )
 
         return result
@@ -93,6 +142,8 @@ class DynamicResourceAllocator:
         Returns:
             bool: True if all allocations were successfully applied, False otherwise
         """
+        from kubernetes.client.rest import ApiException
+
         try:
             successful_updates = []
             
@@ -130,7 +181,7 @@ class DynamicResourceAllocator:
             self.logger.error(f"Failed to apply allocations: {str(e)}")
             return False
 
-    def _get_deployment(self, service_id: str) -> Optional[client.V1Deployment]:
+    def _get_deployment(self, service_id: str) -> Optional['client.V1Deployment']:
         """
         Get current deployment for a service.
         
@@ -140,6 +191,8 @@ class DynamicResourceAllocator:
         Returns:
             Optional[V1Deployment]: The deployment if found, None otherwise
         """
+        from kubernetes.client.rest import ApiException
+
         try:
             return self.apps_v1.read_namespaced_deployment(
                 name=service_id,
@@ -168,6 +221,9 @@ class DynamicResourceAllocator:
         Returns:
             bool: True if update was successful, False otherwise
         """
+        from kubernetes import client
+        from kubernetes.client.rest import ApiException
+
         try:
             # Get current deployment
             deployment = self._get_deployment(service_id)
@@ -0,0 +1,224 @@
+from src.models.data_models import ServiceConfig
+from src.utils.coordination import CoordinationBackend
+from typing import Callable, Dict, Iterable, List, Optional, Set
+import bisect
+import hashlib
+import logging
+import threading
+
+MEMBER_PREFIX = "members/"
+SERVICE_PREFIX = "services/"
+
+
+def _hash(key: str) -> int:
+    return int(hashlib.md5(key.encode()).hexdigest(), 16)
+
+
+class HashRing:
+    """Consistent hash ring mapping keys onto a set of nodes."""
+
+    def __init__(self, nodes: Iterable[str], virtual_nodes: int = 64):
+        self.virtual_nodes = virtual_nodes
+        self._ring: List[tuple] = sorted(
+            (_hash(f"{node}#{i}"), node)
+            for node in set(nodes)
+            for i in range(virtual_nodes)
+        )
+        self._points = [point for point, _ in self._ring]
+
+    def get_node(self, key: str) -> Optional[str]:
+        if not self._ring:
+            return None
+        index = bisect.bisect(self._points, _hash(key)) % len(self._ring)
+        return self._ring[index][1]
+
+
+def group_services(services: Dict[str, ServiceConfig]) -> List[List[str]]:
+    """
+    Partition services into groups connected through shared chains.
+
+    Services that appear in a common chain (directly or transitively) end
+    up in the same group so that a chain is always optimized by a single
+    replica.
+
+    Returns:
+        List[List[str]]: Sorted service IDs per group, groups sorted by
+        their first service ID
+    """
+    parent = {service_id: service_id for service_id in services}
+
+    def find(service_id: str) -> str:
+        while parent[service_id] != service_id:
+            parent[service_id] = parent[parent[service_id]]
+            service_id = parent[service_id]
+        return service_id
+
+    chain_members: Dict[str, str] = {}
+    for service_id, service in services.items():
+        for chain_id in service.chains:
+            if chain_id in chain_members:
+                parent[find(service_id)] = find(chain_members[chain_id])
+            else:
+                chain_members[chain_id] = service_id
+
+    groups: Dict[str, List[str]] = {}
+    for service_id in services:
+        groups.setdefault(find(service_id), []).append(service_id)
+    return sorted(sorted(group) for group in groups.values())
+
+
+class ShardManager:
+    """
+    Decides which services this controller replica owns.
+
+    Replicas announce themselves with a membership lease and place chain
+    groups on a consistent hash ring over the live members. Ownership is
+    enforced with one lease per service: a replica only manages a group once
+    it holds the lease of every service in it, acquired atomically. A
+    service is therefore never optimized by two replicas at once, even while
+    replicas disagree on how services are grouped (e.g. during a rolling
+    config change). A group handed over from another replica is picked up
+    after the previous owner releases it or its leases expire.
+
+    Leases are renewed and rebalanced by a background heartbeat (see
+    ``start``) rather than once per optimization cycle. A cycle that runs
+    longer than ``lease_ttl`` therefore does not silently lose ownership.
+    When a replica joins or leaves, groups are handed over within a couple
+    of heartbeat intervals. A replica that dies stops renewing, and its
+    services move after at most ``lease_ttl``.
+    """
+
+    def __init__(self,
+                 replica_id: str,
+                 backend: CoordinationBackend,
+                 lease_ttl: float = 60.0,
+                 virtual_nodes: int = 64,
+                 heartbeat_interval: Optional[float] = None,
+                 on_change: Optional[Callable[[Set[str]], None]] = None):
+        self.replica_id = replica_id
+        self.backend = backend
+        self.lease_ttl = lease_ttl
+        self.virtual_nodes = virtual_nodes
+        self.heartbeat_interval = heartbeat_interval or lease_ttl / 3
+        # Called with the new set of owned services whenever it changes
+        self.on_change = on_change
+        self.services: Dict[str, ServiceConfig] = {}
+        # group key -> member services; ownership always covers whole groups
+        self.owned_groups: Dict[str, List[str]] = {}
+        self.logger = logging.getLogger(__name__)
+        self.lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._heartbeat_thread: Optional[threading.Thread] = None
+
+    @property
+    def owned_services(self) -> Set[str]:
+        return {service_id for group in self.owned_groups.values()
+                for service_id in group}
+
+    def heartbeat(self) -> None:
+        self.backend.try_acquire(MEMBER_PREFIX + self.replica_id,
+                                 self.replica_id, self.lease_ttl)
+
+    def live_replicas(self) -> List[str]:
+        return sorted(set(self.backend.holders(MEMBER_PREFIX).values()))
+
+    def assign(self, services: Dict[str, ServiceConfig]) -> Dict[str, ServiceConfig]:
+        """
+        Update the known services, rebalance and return owned services.
+
+        Args:
+            services: All services known to the controller
+
+        Returns:
+            Dict[str, ServiceConfig]: The subset of services this replica
+            currently owns
+        """
+        with self.lock:
+            self.services = dict(services)
+            self._rebalance()
+            return {service_id: self.services[service_id]
+                    for service_id in sorted(self.owned_services)}
+
+    def renew(self) -> Set[str]:
+        """
+        Renew leases and rebalance against the services last passed to
+        ``assign``.
+
+        Returns:
+            Set[str]: Services still owned. Groups that moved to another
+            replica, or whose leases were taken over, are dropped.
+        """
+        with self.lock:
+            self._rebalance()
+            return self.owned_services
+
+    def _rebalance(self) -> None:
+        previously_owned = self.owned_services
+        self.heartbeat()
+        ring = HashRing(self.live_replicas(), self.virtual_nodes)
+        groups = {",".join(group): group for group in group_services(self.services)}
+
+        # Give up groups that moved to another replica or are no longer
+        # configured (services added, removed or rewired)
+        for group_key in list(self.owned_groups):
+            if group_key not in groups or ring.get_node(group_key) != self.replica_id:
+                self._release_group(group_key)
+
+        for group_key, group in groups.items():
+            if ring.get_node(group_key) != self.replica_id:
+                continue
+
+            lease_keys = [SERVICE_PREFIX + service_id for service_id in group]
+            if self.backend.try_acquire_all(lease_keys, self.replica_id, self.lease_ttl):
+                if group_key not in self.owned_groups:
+                    self.logger.info(f"Acquired service group {group_key}")
+                self.owned_groups[group_key] = group
+            elif group_key in self.owned_groups:
+                # Another replica took over a member's lease; drop the whole
+                # group so a chain is never managed partially
+                self.logger.warning(f"Lost lease in service group {group_key}")
+                self._release_group(group_key)
+
+        owned = self.owned_services
+        if owned != previously_owned and self.on_change is not None:
+            self.on_change(owned)
+
+    def _release_group(self, group_key: str) -> None:
+        for service_id in self.owned_groups.pop(group_key):
+            self.backend.release(SERVICE_PREFIX + service_id, self.replica_id)
+
+    def start(self) -> None:
+        """
+        Announce this replica and start renewing and rebalancing leases
+        every ``heartbeat_interval`` seconds.
+        """
+        with self.lock:
+            self.heartbeat()
+        self._stop_event.clear()
+        # Daemon thread: if the process dies, renewal must stop with it so
+        # the leases expire and other replicas can take over
+        self._heartbeat_thread = threading.Thread(target=self._heartbeat_loop,
+                                                  daemon=True)
+        self._heartbeat_thread.start()
+
+    def _heartbeat_loop(self):
+        while not self._stop_event.wait(self.heartbeat_interval):
+            try:
+                self.renew()
+            except Exception as e:
+                self.logger.error(f"Failed to renew leases: {str(e)}")
+
+    def stop(self) -> None:
+        """Stop the heartbeat and release all leases."""
+        self._stop_event.set()
+        if self._heartbeat_thread is not None:
+            self._heartbeat_thread.join()
+            self._heartbeat_thread = None
+        self.release_all()
+
+    def release_all(self) -> None:
+        """Give up all leases held by this replica, e.g. on shutdown."""
+        with self.lock:
+            for group_key in list(self.owned_groups):
+                self._release_group(group_key)
+            self.backend.release(MEMBER_PREFIX + self.replica_id, self.replica_id)
@@ -1,5 +1,5 @@
 from src.models.data_models import TrafficMetrics
-from typing import Dict, List
+from typing import Dict, Iterable, List, Optional, Set
 import threading
 import time
 from collections import defaultdict
@@ -10,14 +10,17 @@ class TrafficMonitor:
         self.traffic_data = defaultdict(lambda: defaultdict(list))
         self.live_metrics = defaultdict(lambda: defaultdict(TrafficMetrics))
         self.lock = threading.Lock()
+        self.services: Optional[Set[str]] = None  # None monitors every service
         self.running = True
+        self._stop_event = threading.Event()
         self.monitoring_thread = threading.Thread(target=self._monitor_loop)
         self.monitoring_thread.start()
 
     def _monitor_loop(self):
         while self.running:
             self._collect_metrics()
-            time.sleep(self.sampling_interval)
+            # Wait on an event rather than sleeping so stop() returns promptly
+            self._stop_event.wait(self.sampling_interval)
 
     def _collect_metrics(self):
         with self.lock:
@@ -32,8 +35,18 @@ class TrafficMonitor:
                         'error_rate': metrics.error_rate
                     })
 
+    def set_services(self, service_ids: Iterable[str]):
+        """Restrict monitoring to the given services and drop data for all others."""
+        with self.lock:
+            self.services = set(service_ids)
+            for data in (self.traffic_data, self.live_metrics):
+                for service_id in [s for s in data if s not in self.services]:
+                    del data[service_id]
+
     def record_request(self, service_id: str, chain_id: str, response_time: float, is_error: bool = False):
         with self.lock:
+            if self.services is not None and service_id not in self.services:
+                return
             current_time = time.time()
             metrics = self.live_metrics[service_id][chain_id]
             
@@ -59,4 +72,5 @@ class TrafficMonitor:
 
     def stop(self):
         self.running = False
+        self._stop_event.set()
         self.monitoring_thread.join()
\ No newline at end of file
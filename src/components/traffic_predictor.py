@@ -1,8 +1,5 @@
-import tensorflow as tf
-from tensorflow.keras.layers import GRU, Dense, Dropout, BatchNormalization
-from tensorflow.keras.models import Sequential
 import numpy as np
-from typing import Tuples
+from typing import Any, Tuple
 
 class TrafficPredictor:
     def __init__(self, 
@@ -12,10 +9,22 @@ class TrafficPredictor:
         self.sequence_length = sequence_length
         self.prediction_horizon = prediction_horizon
         self.feature_dim = feature_dim
-        self.model = self._build_model()
+        self._model = None
         self.scaler = None
 
-    def _build_model(self) -> Sequential:
+    @property
+    def model(self) -> Any:
+        # TensorFlow is only imported (and the network built) on first use,
+        # so the controller can start without paying for it.
+        if self._model is None:
+            self._model = self._build_model()
+        return self._model
+
+    def _build_model(self) -> Any:
+        import tensorflow as tf
+        from tensorflow.keras.layers import GRU, Dense, Dropout, BatchNormalization
+        from tensorflow.keras.models import Sequential
+
         model = Sequential([
             # First GRU layer with sequence input
             GRU(128, input_shape=(self.sequence_length, self.feature_dim),
@@ -55,6 +64,9 @@ class TrafficPredictor:
 
     def train(self, historical_data: np.ndarray, epochs: int = 100, 
              batch_size: int = 32, validation_split: float = 0.2):
+        import tensorflow as tf
+        from sklearn.preprocessing import StandardScaler
+
         # Normalize data
         if self.scaler is None:
             self.scaler = StandardScaler()
@@ -85,12 +97,13 @@ class TrafficPredictor:
             recent_data = self.scaler.transform(recent_data)
         
         X = recent_data[-self.sequence_length:].reshape(1, self.sequence_length, self.feature_dim)
-        predictions = self.model.predict(X, verbose=0)
+        # One row of prediction_horizon values for the single input sequence
+        predictions = self.model.predict(X, verbose=0)[0]
         
         if self.scaler is not None:
             # Inverse transform only the traffic predictions
-            predictions_reshaped = np.zeros((len(predictions[0]), self.feature_dim))
-            predictions_reshaped[:, 0] = predictions[0]
+            predictions_reshaped = np.zeros((len(predictions), self.feature_dim))
+            predictions_reshaped[:, 0] = predictions
             predictions = self.scaler.inverse_transform(predictions_reshaped)[:, 0]
         
         return predictions
\ No newline at end of file
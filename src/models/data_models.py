@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import List, Dict
+from typing import Any, List, Dict
 from datetime import datetime
 
 @dataclass
@@ -19,7 +19,38 @@ class ResourceAllocation:
 class ServiceConfig:
     service_id: str
     chains: List[str]
-    min_cpu: float
-    max_cpu: float
-    min_memory: float
-    max_memory: float
\ No newline at end of file
+    min_cpu: float = 0.1  # Minimum CPU cores
+    max_cpu: float = 4.0  # Maximum CPU cores
+    min_memory: float = 128  # Minimum memory in MB
+    max_memory: float = 8192  # Maximum memory in MB
+
+    def __post_init__(self):
+        if self.min_cpu > self.max_cpu:
+            raise ValueError(f"{self.service_id}: min_cpu ({self.min_cpu}) "
+                             f"exceeds max_cpu ({self.max_cpu})")
+        if self.min_memory > self.max_memory:
+            raise ValueError(f"{self.service_id}: min_memory ({self.min_memory}) "
+                             f"exceeds max_memory ({self.max_memory})")
+
+    @classmethod
+    def from_dict(cls, service_id: str, data: Dict[str, Any]) -> 'ServiceConfig':
+        # Bounds missing from the config fall back to the field defaults above
+        bounds = {
+            key: float(data[key])
+            for key in ('min_cpu', 'max_cpu', 'min_memory', 'max_memory')
+            if key in data
+        }
+        return cls(
+            service_id=service_id,
+            chains=list(data.get('chains', [])),
+            **bounds
+        )
+
+@dataclass
+class Lease:
+    key: str
+    holder: str
+    expires_at: float
+
+    def is_expired(self, now: float) -> bool:
+        return now >= self.expires_at
@@ -0,0 +1,185 @@
+from src.models.data_models import Lease
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Callable, ContextManager, Dict, Iterable, Iterator, Optional
+import fcntl
+import json
+import os
+import threading
+import time
+
+
+class CoordinationBackend(ABC):
+    """
+    Lease store shared by controller replicas.
+
+    A lease is held by at most one holder at a time. Holders renew their
+    leases by acquiring them again before they expire; an expired lease can
+    be taken over by anyone. Subclasses only decide where the lease table
+    lives by implementing ``_leases``.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self.clock = clock
+
+    @abstractmethod
+    def _leases(self) -> ContextManager[Dict[str, Lease]]:
+        """Yield the lease table under exclusive access and persist changes."""
+
+    def try_acquire(self, key: str, holder: str, ttl: float) -> bool:
+        """
+        Acquire or renew a lease.
+
+        Args:
+            key: Lease to acquire
+            holder: Identity of the caller
+            ttl: Lease duration in seconds
+
+        Returns:
+            bool: True if the caller now holds the lease, False if another
+            holder owns an unexpired lease on the key
+        """
+        return self.try_acquire_all([key], holder, ttl)
+
+    def try_acquire_all(self, keys: Iterable[str], holder: str, ttl: float) -> bool:
+        """
+        Atomically acquire or renew a set of leases.
+
+        Either every lease is granted to the caller or none is changed.
+
+        Args:
+            keys: Leases to acquire
+            holder: Identity of the caller
+            ttl: Lease duration in seconds
+
+        Returns:
+            bool: True if the caller now holds all the leases, False if any
+            of them is held by another holder
+        """
+        with self._leases() as leases:
+            now = self.clock()
+            keys = list(keys)
+            for key in keys:
+                lease = leases.get(key)
+                if lease is not None and lease.holder != holder and not lease.is_expired(now):
+                    return False
+            for key in keys:
+                leases[key] = Lease(key=key, holder=holder, expires_at=now + ttl)
+            return True
+
+    def release(self, key: str, holder: str) -> None:
+        """Release a lease if it is held by the caller."""
+        with self._leases() as leases:
+            lease = leases.get(key)
+            if lease is not None and lease.holder == holder:
+                del leases[key]
+
+    def holders(self, prefix: str = "") -> Dict[str, str]:
+        """Return key -> holder for all unexpired leases under a prefix."""
+        with self._leases() as leases:
+            now = self.clock()
+            return {
+                key: lease.holder for key, lease in leases.items()
+                if key.startswith(prefix) and not lease.is_expired(now)
+            }
+
+
+class InMemoryCoordinationBackend(CoordinationBackend):
+    """Process-local lease store, for tests and single-host setups."""
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        super().__init__(clock)
+        self._table: Dict[str, Lease] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _leases(self) -> Iterator[Dict[str, Lease]]:
+        with self._lock:
+            yield self._table
+
+
+# Filesystems that replicas on different hosts can mount and lock together
+SHARED_FILESYSTEMS = {
+    'nfs', 'nfs4', 'cifs', 'smb3', 'ceph', 'fuse.cephfs',
+    'glusterfs', 'fuse.glusterfs', 'lustre', 'gpfs'
+}
+
+
+class FileCoordinationBackend(CoordinationBackend):
+    """
+    Lease store kept in a JSON file. Access is serialized with an advisory
+    lock on a sibling ``.lock`` file, so the backend only coordinates
+    replicas that see the same file: replicas on one host, or replicas on
+    several hosts when the file lives on a shared volume with working file
+    locks (e.g. NFSv4). Pod-local paths such as ``/tmp`` give every pod its
+    own lease table and therefore no exclusive ownership at all.
+
+    Lease expiry is an absolute wall-clock time written by one host and
+    compared against another host's clock, so replicas must keep their
+    clocks synchronized (e.g. with NTP). Skew shortens or extends leases by
+    the same amount, and skew larger than the lease TTL breaks exclusivity.
+    """
+
+    def __init__(self, path: str, clock: Callable[[], float] = time.time):
+        super().__init__(clock)
+        self.path = path
+        self.lock_path = f"{path}.lock"
+
+    def filesystem_type(self) -> Optional[str]:
+        """
+        Return the type of the filesystem holding the lease file.
+
+        Returns:
+            Optional[str]: Filesystem type from /proc/mounts, or None if it
+            cannot be determined (e.g. not on Linux)
+        """
+        directory = os.path.realpath(os.path.dirname(os.path.abspath(self.path)))
+        try:
+            with open('/proc/mounts', 'r') as f:
+                mounts = [line.split() for line in f]
+        except OSError:
+            return None
+
+        # The lease file belongs to the longest mount point containing it
+        best_mount, fs_type = '', None
+        for fields in mounts:
+            mount_point = fields[1].replace('\\040', ' ')
+            inside = (directory == mount_point or
+                      directory.startswith(mount_point.rstrip('/') + '/'))
+            if inside and len(mount_point) > len(best_mount):
+                best_mount, fs_type = mount_point, fields[2]
+        return fs_type
+
+    def is_shared(self) -> Optional[bool]:
+        """Whether the lease file is on a filesystem shared across hosts."""
+        fs_type = self.filesystem_type()
+        if fs_type is None:
+            return None
+        return fs_type in SHARED_FILESYSTEMS
+
+    @contextmanager
+    def _leases(self) -> Iterator[Dict[str, Lease]]:
+        with open(self.lock_path, 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                leases = self._read()
+                yield leases
+                self._write(leases)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read(self) -> Dict[str, Lease]:
+        if not os.path.exists(self.path):
+            return {}
+        with open(self.path, 'r') as f:
+            content = f.read()
+        if not content:
+            return {}
+        return {key: Lease(**lease) for key, lease in json.loads(content).items()}
+
+    def _write(self, leases: Dict[str, Lease]) -> None:
+        # Write to a temporary file first so readers never see a partial table
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({key: vars(lease) for key, lease in leases.items()}, f)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,82 @@
+import pytest
+
+from src.utils.coordination import (CoordinationBackend, FileCoordinationBackend,
+                                    InMemoryCoordinationBackend)
+
+
+@pytest.fixture(params=['memory', 'file'])
+def backend(request, clock, tmp_path):
+    if request.param == 'memory':
+        return InMemoryCoordinationBackend(clock=clock)
+    return FileCoordinationBackend(str(tmp_path / 'leases.json'), clock=clock)
+
+
+def test_acquire_is_exclusive_until_expiry(backend, clock):
+    assert backend.try_acquire('services/a', 'r1', ttl=10)
+    assert not backend.try_acquire('services/a', 'r2', ttl=10)
+
+    clock.now = 9.9
+    assert not backend.try_acquire('services/a', 'r2', ttl=10)
+
+    clock.now = 10.0
+    assert backend.try_acquire('services/a', 'r2', ttl=10)
+    assert backend.holders() == {'services/a': 'r2'}
+
+
+def test_holder_renews_its_lease(backend, clock):
+    assert backend.try_acquire('services/a', 'r1', ttl=10)
+    clock.now = 8
+    assert backend.try_acquire('services/a', 'r1', ttl=10)
+
+    clock.now = 15
+    assert not backend.try_acquire('services/a', 'r2', ttl=10)
+
+
+def test_release_only_by_holder(backend):
+    backend.try_acquire('services/a', 'r1', ttl=10)
+
+    backend.release('services/a', 'r2')
+    assert backend.holders() == {'services/a': 'r1'}
+
+    backend.release('services/a', 'r1')
+    assert backend.holders() == {}
+    assert backend.try_acquire('services/a', 'r2', ttl=10)
+
+
+def test_holders_filters_prefix_and_expired(backend, clock):
+    backend.try_acquire('members/r1', 'r1', ttl=5)
+    backend.try_acquire('members/r2', 'r2', ttl=20)
+    backend.try_acquire('services/a', 'r1', ttl=20)
+
+    clock.now = 10
+    assert backend.holders('members/') == {'members/r2': 'r2'}
+
+
+def test_acquire_all_is_atomic(backend):
+    backend.try_acquire('services/b', 'r2', ttl=10)
+
+    assert not backend.try_acquire_all(['services/a', 'services/b'], 'r1', ttl=10)
+    assert backend.holders() == {'services/b': 'r2'}
+
+    assert backend.try_acquire_all(['services/a', 'services/c'], 'r1', ttl=10)
+    assert backend.holders() == {
+        'services/a': 'r1', 'services/b': 'r2', 'services/c': 'r1'
+    }
+
+
+def test_file_backend_is_shared_between_instances(tmp_path, clock):
+    path = str(tmp_path / 'leases.json')
+    first = FileCoordinationBackend(path, clock=clock)
+    second = FileCoordinationBackend(path, clock=clock)
+
+    assert first.try_acquire('services/a', 'r1', ttl=10)
+    assert not second.try_acquire('services/a', 'r2', ttl=10)
+    assert second.holders() == {'services/a': 'r1'}
+
+
+def test_incomplete_backend_cannot_be_constructed():
+    class NoStorage(CoordinationBackend):
+        pass
+
+    with pytest.raises(TypeError):
+        NoStorage()
@@ -0,0 +1,28 @@
+import pytest
+
+from src.models.data_models import ServiceConfig
+
+
+def test_from_dict_uses_default_bounds():
+    service = ServiceConfig.from_dict('auth-service', {'chains': ['login']})
+
+    assert service == ServiceConfig(service_id='auth-service', chains=['login'],
+                                    min_cpu=0.1, max_cpu=4.0,
+                                    min_memory=128, max_memory=8192)
+
+
+def test_from_dict_overrides_bounds():
+    service = ServiceConfig.from_dict('auth-service', {'max_cpu': 2, 'min_memory': '256'})
+
+    assert service.max_cpu == 2.0
+    assert service.min_memory == 256.0
+    assert service.chains == []
+
+
+@pytest.mark.parametrize('bounds', [
+    {'min_cpu': 2.0, 'max_cpu': 1.0},
+    {'min_memory': 1024, 'max_memory': 512},
+])
+def test_from_dict_rejects_min_above_max(bounds):
+    with pytest.raises(ValueError):
+        ServiceConfig.from_dict('auth-service', bounds)
@@ -0,0 +1,175 @@
+import pytest
+
+from src.components.shard_manager import HashRing, ShardManager, group_services
+from src.models.data_models import ServiceConfig
+from src.utils.coordination import InMemoryCoordinationBackend
+
+
+def make_services(chains_by_service):
+    return {
+        service_id: ServiceConfig(service_id=service_id, chains=chains)
+        for service_id, chains in chains_by_service.items()
+    }
+
+
+@pytest.fixture
+def backend(clock):
+    return InMemoryCoordinationBackend(clock=clock)
+
+
+@pytest.fixture
+def services():
+    # 30 services on 10 independent chains, plus one linking chains 0 and 1
+    chains = {f"s{i}": [f"c{i % 10}"] for i in range(30)}
+    chains['bridge'] = ['c0', 'c1']
+    return make_services(chains)
+
+
+def test_group_services_merges_transitive_chains():
+    services = make_services({
+        'a': ['c1'],
+        'b': ['c1', 'c2'],
+        'c': ['c2', 'c3'],
+        'd': ['c3'],
+        'e': ['c4'],
+        'f': [],
+    })
+
+    assert group_services(services) == [['a', 'b', 'c', 'd'], ['e'], ['f']]
+
+
+def test_hash_ring_is_stable_when_node_added():
+    keys = [f"group-{i}" for i in range(500)]
+    before = HashRing(['r1', 'r2', 'r3'])
+    after = HashRing(['r1', 'r2', 'r3', 'r4'])
+
+    moved = [key for key in keys if before.get_node(key) != after.get_node(key)]
+
+    assert all(after.get_node(key) == 'r4' for key in moved)
+    assert 0 < len(moved) < len(keys) / 2
+
+
+def test_hash_ring_without_nodes():
+    assert HashRing([]).get_node('group') is None
+
+
+def test_replicas_never_own_the_same_service(backend, services):
+    replicas = [ShardManager(f"r{i}", backend, lease_ttl=10) for i in range(2)]
+    for replica in replicas:
+        replica.heartbeat()
+
+    for _ in range(3):
+        owned = [set(replica.assign(services)) for replica in replicas]
+        assert not owned[0] & owned[1]
+    assert owned[0] | owned[1] == set(services)
+    assert owned[0] and owned[1]
+
+
+def test_chains_stay_on_one_replica(backend, services):
+    replicas = [ShardManager(f"r{i}", backend, lease_ttl=10) for i in range(3)]
+    for replica in replicas:
+        replica.heartbeat()
+    owned = [set(replica.assign(services)) for replica in replicas]
+
+    for group in group_services(services):
+        assert sum(set(group) <= replica_owned for replica_owned in owned) == 1
+
+
+def test_replicas_with_different_configs_do_not_overlap(backend, services):
+    updated = dict(services)
+    updated['new'] = ServiceConfig(service_id='new', chains=['c0'])
+    old_replica = ShardManager('r0', backend, lease_ttl=10)
+    new_replica = ShardManager('r1', backend, lease_ttl=10)
+    old_replica.heartbeat()
+    new_replica.heartbeat()
+
+    for _ in range(3):
+        old_owned = set(old_replica.assign(services))
+        new_owned = set(new_replica.assign(updated))
+        assert not old_owned & new_owned
+
+
+def test_expired_leases_move_and_are_dropped_on_renew(backend, clock, services):
+    first = ShardManager('r0', backend, lease_ttl=10)
+    first.assign(services)
+    assert first.owned_services == set(services)
+
+    # r0 stops renewing; r1 joins after its leases have expired
+    clock.now = 11
+    second = ShardManager('r1', backend, lease_ttl=10)
+    second.heartbeat()
+    taken = set(second.assign(services))
+    assert taken
+
+    assert not first.renew() & taken
+
+
+def test_renew_keeps_ownership_past_ttl(backend, clock, services):
+    first = ShardManager('r0', backend, lease_ttl=10)
+    owned = set(first.assign(services))
+
+    for _ in range(5):
+        clock.now += 5
+        assert first.renew() == owned
+
+    second = ShardManager('r1', backend, lease_ttl=10)
+    assert not set(second.assign(services)) & owned
+
+
+def test_release_all_frees_every_lease(backend, services):
+    manager = ShardManager('r0', backend, lease_ttl=10)
+    manager.assign(services)
+
+    manager.release_all()
+
+    assert backend.holders() == {}
+    assert manager.owned_services == set()
+
+
+def test_replicas_joining_one_after_another_rebalance_on_heartbeat(backend, services):
+    replicas = []
+    for i in range(3):
+        # The newcomer joins while the others already hold every lease
+        newcomer = ShardManager(f"r{i}", backend, lease_ttl=10)
+        newcomer.assign(services)
+        replicas.append(newcomer)
+
+        # Within two heartbeat rounds the others release the newcomer's share
+        # and the newcomer picks it up, without another assign() call
+        for _ in range(2):
+            for replica in replicas:
+                replica.renew()
+                owned = [r.owned_services for r in replicas]
+                assert sum(len(o) for o in owned) == len(set().union(*owned))
+
+        owned = [replica.owned_services for replica in replicas]
+        assert all(owned)
+        assert set().union(*owned) == set(services)
+
+
+def test_on_change_reports_ownership_changes(backend, services):
+    changes = []
+    first = ShardManager('r0', backend, lease_ttl=10, on_change=changes.append)
+    first.assign(services)
+    assert changes == [set(services)]
+
+    first.renew()
+    assert len(changes) == 1
+
+    second = ShardManager('r1', backend, lease_ttl=10)
+    second.heartbeat()
+    first.renew()
+    assert changes[-1] == first.owned_services != set(services)
+
+
+def test_losing_one_lease_drops_the_whole_group(backend, clock):
+    services = make_services({'a': ['c1'], 'b': ['c1', 'c2'], 'c': ['c2'], 'd': ['c3']})
+    manager = ShardManager('r0', backend, lease_ttl=10)
+    manager.assign(services)
+
+    # The lease on 'b' expires and another holder takes it over
+    clock.now = 11
+    assert backend.try_acquire('services/b', 'r1', ttl=10)
+
+    assert manager.renew() == {'d'}
+    assert backend.holders('services/') == {'services/b': 'r1', 'services/d': 'r0'}
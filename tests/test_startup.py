@@ -0,0 +1,31 @@
+import json
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ['tensorflow', 'pulp', 'scipy', 'kubernetes']
+
+
+def loaded_heavy_modules(code: str):
+    # Run in a fresh interpreter so modules imported by other tests do not leak in
+    script = (
+        f"import json, sys\n{code}\n"
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+    result = subprocess.run([sys.executable, '-c', script], cwd=REPO_ROOT,
+                            capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_importing_main_does_not_load_heavy_dependencies():
+    assert loaded_heavy_modules("import main") == []
+
+
+def test_building_components_does_not_load_heavy_dependencies():
+    code = (
+        "import main\n"
+        "monitor, allocator = main.build_components(main.load_config())\n"
+        "monitor.stop()"
+    )
+    assert loaded_heavy_modules(code) == []